@@ -0,0 +1,116 @@
+"""
+JIT-compiled CRSF parsing kernels
+
+Sync search, frame validation, CRC and payload decoding for a whole receive
+buffer in a single Numba call. Requires numba; crsf_receiver falls back to
+its pure-Python parser when this module cannot be imported.
+
+Kernels are compiled lazily (no explicit signatures) so both writable and
+read-only uint8 buffers are accepted.
+"""
+
+import numpy as np
+from numba import njit
+
+# Mirrors CRSFFrameType in crsf_receiver
+RC_CHANNELS_PACKED = 0x16
+LINK_STATISTICS = 0x14
+
+# Number of link statistics fields written to stats_out
+LINK_STATS_FIELDS = 7
+
+
+@njit(cache=True)
+def crc8_dvbs2(table, buf):
+    """CRSF CRC8 (DVB-S2) over a uint8 buffer"""
+    crc = 0
+    for b in buf:
+        crc = table[crc ^ b]
+    return crc
+
+
+@njit(cache=True)
+def unpack_channels(src, dst):
+    """Unpack 16 packed 11-bit channels from src into dst"""
+    acc = np.uint64(0)
+    nbits = np.uint64(0)
+    p = 0
+    for i in range(16):
+        while nbits < 11:
+            acc |= np.uint64(src[p]) << nbits
+            p += 1
+            nbits += np.uint64(8)
+        dst[i] = acc & np.uint64(0x7FF)
+        acc >>= np.uint64(11)
+        nbits -= np.uint64(11)
+
+
+@njit(cache=True)
+def process_buffer(buf, rpos, wpos, valid_addr, crc_table, max_length,
+                   ch_out, stats_out):
+    """
+    Parse every complete CRSF frame in buf[rpos:wpos]
+
+    Args:
+        buf (ndarray): uint8 receive buffer
+        rpos (int): Position of the first unparsed byte
+        wpos (int): Position one past the last received byte
+        valid_addr (ndarray): 256-entry bool mask of valid address bytes
+        crc_table (ndarray): 256-entry uint8 CRC8 lookup table
+        max_length (int): Largest accepted frame length byte
+        ch_out (ndarray): uint16[16] channel values, updated in place
+        stats_out (ndarray): int[7] link statistics, updated in place
+
+    Returns:
+        tuple: (new_rpos, n_frames, n_errors, got_channels, got_stats)
+    """
+    n_frames = 0
+    n_errors = 0
+    got_channels = False
+    got_stats = False
+
+    while wpos - rpos >= 4:
+        # Find sync byte (device address)
+        if not valid_addr[buf[rpos]]:
+            rpos += 1
+            continue
+
+        frame_length = buf[rpos + 1]
+        if frame_length > max_length:
+            rpos += 1
+            continue
+
+        # Wait for complete frame (address + length + payload + crc)
+        total_length = frame_length + 2
+        if wpos - rpos < total_length:
+            break
+
+        start = rpos
+        end = rpos + total_length
+        rpos = end
+        if total_length < 4:
+            continue
+
+        # Verify CRC over type + payload
+        if crc8_dvbs2(crc_table, buf[start + 2:end - 1]) != buf[end - 1]:
+            n_errors += 1
+            continue
+
+        n_frames += 1
+
+        frame_type = buf[start + 2]
+        payload = buf[start + 3:end - 1]
+        if frame_type == RC_CHANNELS_PACKED:
+            if payload.size >= 22:
+                unpack_channels(payload, ch_out)
+                got_channels = True
+        elif frame_type == LINK_STATISTICS:
+            if payload.size >= 10:
+                for i in range(LINK_STATS_FIELDS):
+                    stats_out[i] = payload[i]
+                # Uplink SNR is signed
+                if stats_out[3] > 127:
+                    stats_out[3] -= 256
+                got_stats = True
+
+    return rpos, n_frames, n_errors, got_channels, got_stats
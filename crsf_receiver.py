@@ -7,12 +7,21 @@ This program reads CRSF (Crossfire) protocol frames from ExpressLRS receiver
 connected to Raspberry Pi GPIO14/15.
 """
 
+import array
+import os
+import select
 import serial
-import struct
 import time
 import sys
 from enum import IntEnum
 
+import numpy as np
+
+try:
+    import _kernel
+except ImportError:  # numba is optional; fall back to pure Python
+    _kernel = None
+
 
 class CRSFFrameType(IntEnum):
     """CRSF Frame Types"""
@@ -49,6 +58,89 @@ class CRSFAddress(IntEnum):
     CRSF_TRANSMITTER = 0xEE
 
 
+# Frame types dispatched by the parser, as plain ints
+_RC_CHANNELS_PACKED = int(CRSFFrameType.RC_CHANNELS_PACKED)
+_LINK_STATISTICS = int(CRSFFrameType.LINK_STATISTICS)
+
+
+def _build_crc8_table(poly):
+    """
+    Build a 256-entry lookup table for a CRC8 polynomial
+    
+    Args:
+        poly (int): CRC8 polynomial
+        
+    Returns:
+        list: CRC8 value for every possible input byte
+    """
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x80:
+                crc = (crc << 1) ^ poly
+            else:
+                crc = crc << 1
+        table.append(crc & 0xFF)
+    return table
+
+
+def _build_crc8_slice_tables(table, count=4):
+    """
+    Build lookup tables for processing several bytes per step
+    
+    The CRC is linear, so feeding count bytes d0..dn through the table one
+    at a time equals T^count[crc ^ d0] ^ ... ^ T^1[dn], where T^k is the
+    table applied k times.
+    
+    Args:
+        table (bytes): Single-byte CRC8 lookup table
+        count (int): Number of bytes processed per step
+        
+    Returns:
+        tuple: Tables T^1..T^count
+    """
+    tables = [bytes(table)]
+    for _ in range(count - 1):
+        tables.append(bytes(table[x] for x in tables[-1]))
+    return tuple(tables)
+
+
+# CRSF CRC8 (DVB-S2, poly 0xD5) lookup table
+_CRC8_DVBS2_TABLE = bytes(_build_crc8_table(poly=0xD5))
+_CRC8_DVBS2_SLICE4 = _build_crc8_slice_tables(_CRC8_DVBS2_TABLE, count=4)
+_CRC8_DVBS2_TABLE_NP = np.asarray(bytearray(_CRC8_DVBS2_TABLE), dtype=np.uint8)
+
+
+def _build_channel_unpacker(count=16, bits=11):
+    """
+    Generate a fully unrolled unpacker for packed RC channel data
+    
+    Args:
+        count (int): Number of channels
+        bits (int): Bits per channel
+        
+    Returns:
+        function: unpack(data, out) storing each channel of the
+            little-endian packed data into out[0..count-1]
+    """
+    mask = (1 << bits) - 1
+    lines = [
+        "def unpack(data, out):",
+        "    x = int.from_bytes(data, 'little')",
+        f"    out[0] = x & {mask:#x}",
+    ]
+    for i in range(1, count):
+        lines.append(f"    out[{i}] = (x >> {i * bits}) & {mask:#x}")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['unpack']
+
+
+# CRSF RC channels: 16 channels x 11 bits packed into 22 bytes
+_unpack16 = _build_channel_unpacker(count=16, bits=11)
+
+
 class CRSFReceiver:
     """
     CRSF Protocol Receiver for ExpressLRS
@@ -59,24 +151,48 @@ class CRSFReceiver:
     CRSF_BAUDRATE = 420000  # CRSF standard baudrate
     CRSF_SYNC_BYTE = 0xC8   # Frame sync byte
     CRSF_MAX_PACKET_SIZE = 64
+    READ_CHUNK_SIZE = 4096  # Max bytes fetched per serial read
+    RING_BUFFER_SIZE = 8192  # Fixed receive buffer size
+    
+    # Valid device address bytes for frame sync
+    _VALID_ADDRESSES = frozenset(int(addr) for addr in CRSFAddress)
+    _VALID_ADDRESS_MASK = np.zeros(256, dtype=np.bool_)
+    _VALID_ADDRESS_MASK[list(_VALID_ADDRESSES)] = True
     
-    def __init__(self, port='/dev/serial0', baudrate=None, timeout=0.1):
+    def __init__(self, port='/dev/serial0', baudrate=None, timeout=0.001):
         """
         Initialize CRSF receiver
         
         Args:
             port (str): Serial port device path
             baudrate (int): Baudrate (default: 420000 for CRSF)
-            timeout (float): Read timeout in seconds
+            timeout (float): Read timeout in seconds; read_frame blocks for
+                at most this long waiting for data (None blocks until data
+                arrives)
         """
         self.port = port
         self.baudrate = baudrate or self.CRSF_BAUDRATE
         self.timeout = timeout
         self.serial = None
-        self.buffer = bytearray()
+        self._fd = None
+        self._poller = None
+        
+        # Fixed receive buffer; unparsed data is ring[_rpos:_wpos]. The
+        # buffer is never resized, so its views can be kept for its lifetime.
+        self._ring = bytearray(self.RING_BUFFER_SIZE)
+        self._ring_view = memoryview(self._ring)
+        self._ring_np = np.frombuffer(self._ring, dtype=np.uint8)
+        self._rpos = 0
+        self._wpos = 0
         
-        # Channel data (16 channels, 11-bit resolution)
-        self.channels = [0] * 16
+        # Channel data (16 channels, 11-bit resolution). Stored in an
+        # array.array so the Python parser writes plain C integers; the
+        # NumPy array is a view of the same memory for the kernel.
+        self.channels = array.array('H', [0] * 16)
+        self._channels_np = np.frombuffer(self.channels, dtype=np.uint16)
+        self._channels_ro = self._channels_np.view()  # For get_channels_array
+        self._channels_ro.flags.writeable = False
+        self._channels_tuple = None  # Cached get_channels result
         
         # Link statistics
         self.rssi_1 = 0
@@ -86,6 +202,7 @@ class CRSFReceiver:
         self.active_antenna = 0
         self.rf_mode = 0
         self.tx_power = 0
+        self._link_stats_np = np.zeros(7, dtype=np.int16)
         
         # Frame statistics
         self.frame_count = 0
@@ -102,6 +219,11 @@ class CRSFReceiver:
                 stopbits=serial.STOPBITS_ONE,
                 timeout=self.timeout
             )
+            # pyserial handles port setup (including the non-standard
+            # 420000 baudrate); reads go straight to the descriptor
+            self._fd = self.serial.fileno()
+            self._poller = select.poll()
+            self._poller.register(self._fd, select.POLLIN)
             print(f"CRSF receiver opened on {self.port}")
             print(f"Baudrate: {self.baudrate} bps")
             return True
@@ -111,29 +233,33 @@ class CRSFReceiver:
     
     def close(self):
         """Close serial port connection"""
+        self._poller = None
+        self._fd = None
         if self.serial and self.serial.is_open:
             self.serial.close()
             print("Serial port closed")
     
-    def _calculate_crc(self, data):
+    def _calculate_crc(self, data, _tables=_CRC8_DVBS2_SLICE4):
         """
         Calculate CRSF CRC8 (DVB-S2)
         
         Args:
-            data (bytes): Data to calculate CRC for
+            data (bytes-like): Data to calculate CRC for
             
         Returns:
             int: CRC8 value
         """
+        # Tables are bound as a default argument so the lookup stays local
+        t1, t2, t3, t4 = _tables
         crc = 0
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = (crc << 1) ^ 0xD5
-                else:
-                    crc = crc << 1
-            crc &= 0xFF
+        
+        # Four bytes per iteration, then the remaining tail byte by byte
+        end = len(data) & ~3
+        for i in range(0, end, 4):
+            crc = (t4[crc ^ data[i]] ^ t3[data[i + 1]]
+                   ^ t2[data[i + 2]] ^ t1[data[i + 3]])
+        for i in range(end, len(data)):
+            crc = t1[crc ^ data[i]]
         return crc
     
     def _parse_rc_channels(self, payload):
@@ -141,24 +267,22 @@ class CRSFReceiver:
         Parse RC channels from CRSF frame
         
         Args:
-            payload (bytes): Frame payload
+            payload (bytes-like): Frame payload
         """
         if len(payload) < 22:
             return
         
         # CRSF uses 11-bit channel data, packed
         # 16 channels packed into 22 bytes
-        bits = int.from_bytes(payload[:22], byteorder='little')
-        
-        for i in range(16):
-            self.channels[i] = (bits >> (i * 11)) & 0x7FF
+        _unpack16(payload[:22], self.channels)
+        self._channels_tuple = None
     
     def _parse_link_statistics(self, payload):
         """
         Parse link statistics from CRSF frame
         
         Args:
-            payload (bytes): Frame payload
+            payload (bytes-like): Frame payload
         """
         if len(payload) < 10:
             return
@@ -166,7 +290,8 @@ class CRSFReceiver:
         self.rssi_1 = payload[0]  # Uplink RSSI ant. 1 (dBm)
         self.rssi_2 = payload[1]  # Uplink RSSI ant. 2 (dBm)
         self.link_quality = payload[2]  # Uplink link quality (0-100%)
-        self.snr = struct.unpack('b', bytes([payload[3]]))[0]  # Uplink SNR (dB)
+        snr = payload[3]
+        self.snr = snr - 256 if snr & 0x80 else snr  # Uplink SNR (dB, signed)
         self.active_antenna = payload[4]  # Diversity active antenna
         self.rf_mode = payload[5]  # RF Mode
         self.tx_power = payload[6]  # Uplink TX power
@@ -176,7 +301,7 @@ class CRSFReceiver:
         Parse a complete CRSF frame
         
         Args:
-            frame (bytes): Complete CRSF frame
+            frame (memoryview): Complete CRSF frame
         """
         if len(frame) < 4:
             return
@@ -197,62 +322,145 @@ class CRSFReceiver:
         self.frame_count += 1
         
         # Parse based on frame type
-        if frame_type == CRSFFrameType.RC_CHANNELS_PACKED:
+        if frame_type == _RC_CHANNELS_PACKED:
             self._parse_rc_channels(payload)
-        elif frame_type == CRSFFrameType.LINK_STATISTICS:
+        elif frame_type == _LINK_STATISTICS:
             self._parse_link_statistics(payload)
     
     def read_frame(self):
         """
         Read and parse CRSF frames from serial port
         
+        All complete frames in the buffer are parsed in one call.
+        
         Returns:
-            bool: True if frame was parsed successfully
+            int: Number of frames consumed (including CRC failures)
+            
+        Raises:
+            serial.SerialException: If the port is disconnected or the
+                read fails
         """
         if not self.serial or not self.serial.is_open:
-            return False
+            return 0
+        
+        # Reclaim consumed space; pending bytes are moved to the front only
+        # when there is no longer room for a full read at the end
+        if self._rpos == self._wpos:
+            self._rpos = self._wpos = 0
+        elif len(self._ring) - self._wpos < self.READ_CHUNK_SIZE:
+            pending = self._wpos - self._rpos
+            self._ring_np[:pending] = self._ring_np[self._rpos:self._wpos]
+            self._rpos = 0
+            self._wpos = pending
         
-        # Read available data
-        if self.serial.in_waiting > 0:
-            data = self.serial.read(self.serial.in_waiting)
-            self.buffer.extend(data)
+        # Wait up to the timeout for data, then read straight into the buffer
+        free = min(len(self._ring) - self._wpos, self.READ_CHUNK_SIZE)
+        timeout = -1 if self.timeout is None else self.timeout * 1000
+        if free and self._poller.poll(timeout):
+            try:
+                n = os.readv(
+                    self._fd, [self._ring_view[self._wpos:self._wpos + free]]
+                )
+            except BlockingIOError:
+                n = None
+            except OSError as e:
+                raise serial.SerialException(f"read failed: {e}") from e
+            if n == 0:
+                # Same condition pyserial reports for a disconnected device
+                raise serial.SerialException(
+                    "device reports readiness to read but returned no data "
+                    "(device disconnected or multiple access on port?)"
+                )
+            if n:
+                self._wpos += n
+        
+        if _kernel is not None:
+            return self._process_buffer()
+        
+        parsed = 0
         
         # Look for sync byte
-        while len(self.buffer) >= 4:
+        while self._wpos - self._rpos >= 4:
             # Find sync byte (device address)
-            if self.buffer[0] not in [addr.value for addr in CRSFAddress]:
-                self.buffer.pop(0)
+            if self._ring[self._rpos] not in self._VALID_ADDRESSES:
+                self._rpos += 1
                 continue
             
             # Check if we have enough data for the frame
-            frame_length = self.buffer[1]
+            frame_length = self._ring[self._rpos + 1]
             if frame_length > self.CRSF_MAX_PACKET_SIZE:
-                self.buffer.pop(0)
+                self._rpos += 1
                 continue
             
             # Wait for complete frame (address + length + payload + crc)
             total_length = frame_length + 2
-            if len(self.buffer) < total_length:
+            if self._wpos - self._rpos < total_length:
                 break
             
-            # Extract frame
-            frame = bytes(self.buffer[:total_length])
-            self.buffer = self.buffer[total_length:]
+            start = self._rpos
+            self._rpos += total_length
             
-            # Parse frame
-            self._parse_frame(frame)
-            return True
+            # Too short to hold a type and CRC; drop without counting
+            if total_length < 4:
+                continue
+            
+            # Parse frame in place through a view of the buffer
+            self._parse_frame(self._ring_view[start:self._rpos])
+            parsed += 1
         
-        return False
+        return parsed
+    
+    def _process_buffer(self):
+        """
+        Parse all complete frames in the buffer with the JIT kernel
+        
+        Returns:
+            int: Number of frames consumed (including CRC failures)
+        """
+        if self._wpos - self._rpos < 4:
+            return 0
+        
+        self._rpos, frames, errors, got_channels, got_stats = \
+            _kernel.process_buffer(
+                self._ring_np, self._rpos, self._wpos,
+                self._VALID_ADDRESS_MASK, _CRC8_DVBS2_TABLE_NP,
+                self.CRSF_MAX_PACKET_SIZE,
+                self._channels_np, self._link_stats_np
+            )
+        
+        self.frame_count += frames
+        self.error_count += errors
+        
+        if got_channels:
+            self._channels_tuple = None
+        if got_stats:
+            (self.rssi_1, self.rssi_2, self.link_quality, self.snr,
+             self.active_antenna, self.rf_mode,
+             self.tx_power) = self._link_stats_np.tolist()
+        
+        return frames + errors
     
     def get_channels(self):
         """
         Get current RC channel values
         
         Returns:
-            list: List of 16 channel values (0-2047, 11-bit)
+            tuple: 16 channel values (0-2047, 11-bit), cached until new
+                channel data arrives
         """
-        return self.channels.copy()
+        if self._channels_tuple is None:
+            self._channels_tuple = tuple(self.channels)
+        return self._channels_tuple
+    
+    def get_channels_array(self):
+        """
+        Get current RC channel values without copying
+        
+        Returns:
+            ndarray: Read-only uint16 view of the 16 channel values; it is
+                updated in place as frames arrive
+        """
+        return self._channels_ro
     
     def get_channels_normalized(self):
         """
@@ -262,7 +470,7 @@ class CRSFReceiver:
             list: List of 16 normalized channel values
         """
         # CRSF center is 992, range is 172-1811
-        return [(ch - 992) / 819.0 for ch in self.channels]
+        return ((self._channels_np.astype(np.float64) - 992.0) / 819.0).tolist()
     
     def get_channels_microseconds(self):
         """
@@ -272,7 +480,8 @@ class CRSFReceiver:
             list: List of 16 channel values in microseconds
         """
         # Convert 11-bit (172-1811) to microseconds (1000-2000)
-        return [int(1000 + (ch - 172) * 1000 / 1639) for ch in self.channels]
+        # Floor division matches int() truncation as the result is positive
+        return (1000 + (self._channels_np.astype(np.int32) - 172) * 1000 // 1639).tolist()
     
     def get_link_statistics(self):
         """
@@ -305,38 +514,51 @@ class CRSFReceiver:
         }
 
 
-def print_channels(crsf):
-    """Print channel values"""
+def _render(crsf, eol="\n"):
+    """
+    Format one monitor update
+    
+    Args:
+        crsf (CRSFReceiver): CRSF receiver instance
+        eol (str): Line terminator
+        
+    Returns:
+        str: Channel values, link statistics and frame statistics
+    """
     channels = crsf.get_channels()
     channels_us = crsf.get_channels_microseconds()
-    
-    print("\n" + "=" * 80)
-    print("RC Channels (11-bit / microseconds):")
-    print("-" * 80)
-    
-    for i in range(0, 16, 4):
-        line = ""
-        for j in range(4):
-            ch = i + j
-            if ch < 16:
-                line += f"Ch{ch+1:2d}: {channels[ch]:4d} ({channels_us[ch]:4d}µs)  "
-        print(line)
-
-
-def print_link_stats(crsf):
-    """Print link statistics"""
     stats = crsf.get_link_statistics()
+    frame_stats = crsf.get_statistics()
     
-    print("\n" + "=" * 80)
-    print("Link Statistics:")
-    print("-" * 80)
-    print(f"RSSI 1:        {stats['rssi_1']:3d} dBm")
-    print(f"RSSI 2:        {stats['rssi_2']:3d} dBm")
-    print(f"Link Quality:  {stats['link_quality']:3d} %")
-    print(f"SNR:           {stats['snr']:3d} dB")
-    print(f"Active Ant:    {stats['active_antenna']}")
-    print(f"RF Mode:       {stats['rf_mode']}")
-    print(f"TX Power:      {stats['tx_power']}")
+    lines = [
+        "",
+        "=" * 80,
+        "RC Channels (11-bit / microseconds):",
+        "-" * 80,
+    ]
+    for i in range(0, 16, 4):
+        lines.append("".join(
+            f"Ch{ch+1:2d}: {channels[ch]:4d} ({channels_us[ch]:4d}µs)  "
+            for ch in range(i, i + 4)
+        ))
+    lines += [
+        "",
+        "=" * 80,
+        "Link Statistics:",
+        "-" * 80,
+        f"RSSI 1:        {stats['rssi_1']:3d} dBm",
+        f"RSSI 2:        {stats['rssi_2']:3d} dBm",
+        f"Link Quality:  {stats['link_quality']:3d} %",
+        f"SNR:           {stats['snr']:3d} dB",
+        f"Active Ant:    {stats['active_antenna']}",
+        f"RF Mode:       {stats['rf_mode']}",
+        f"TX Power:      {stats['tx_power']}",
+        "",
+        f"Frames: {frame_stats['frame_count']}, "
+        f"Errors: {frame_stats['error_count']}, "
+        f"Error Rate: {frame_stats['error_rate']:.2%}",
+    ]
+    return eol.join(lines) + eol
 
 
 def continuous_monitor(crsf, duration=None):
@@ -347,34 +569,54 @@ def continuous_monitor(crsf, duration=None):
         crsf (CRSFReceiver): CRSF receiver instance
         duration (float): Duration in seconds (None for infinite)
     """
-    print("\n" + "=" * 80)
-    print("CRSF Monitor Mode")
-    print("Press Ctrl+C to stop")
-    print("=" * 80)
+    banner = "\n".join([
+        "=" * 80,
+        "CRSF Monitor Mode",
+        "Press Ctrl+C to stop",
+        "=" * 80,
+    ]) + "\n"
+    
+    if sys.stdout.isatty():
+        # Clear the screen once; each update then redraws in place from the
+        # top left corner, clearing the remainder of each line so shorter
+        # values leave no residue
+        sys.stdout.write("\x1b[H\x1b[2J")
+        prefix = "\x1b[H" + banner
+        eol = "\x1b[K\n"
+    else:
+        # Redirected output scrolls without escape codes
+        sys.stdout.write("\n" + banner)
+        prefix = ""
+        eol = "\n"
     
-    start_time = time.time()
-    last_print = 0
+    # Monotonic clock so wall-clock adjustments do not affect timing
+    start_time = time.monotonic()
+    deadline = start_time + duration if duration else None
+    last_print = float('-inf')
+    last_frames = None  # Frames seen at the last redraw
     
     try:
         while True:
-            if duration and (time.time() - start_time) > duration:
+            now = time.monotonic()
+            if deadline is not None and now > deadline:
                 break
             
-            crsf.read_frame()
-            
-            # Print updates every 0.5 seconds
-            if time.time() - last_print > 0.5:
-                print_channels(crsf)
-                print_link_stats(crsf)
-                
-                frame_stats = crsf.get_statistics()
-                print(f"\nFrames: {frame_stats['frame_count']}, "
-                      f"Errors: {frame_stats['error_count']}, "
-                      f"Error Rate: {frame_stats['error_rate']:.2%}")
-                
-                last_print = time.time()
+            # read_frame paces the loop with its poll timeout; without an
+            # open port or with a zero timeout it returns immediately
+            if not crsf.serial or not crsf.serial.is_open:
+                print("\nSerial port is not open; monitoring stopped")
+                break
+            if not crsf.read_frame() and crsf.timeout == 0:
+                time.sleep(0.001)
             
-            time.sleep(0.001)  # Small delay
+            # Print updates every 0.5 seconds, only if frames have arrived
+            if now - last_print > 0.5:
+                frames = crsf.frame_count + crsf.error_count
+                if frames != last_frames:
+                    sys.stdout.write(prefix + _render(crsf, eol))
+                    sys.stdout.flush()
+                    last_frames = frames
+                last_print = now
     
     except KeyboardInterrupt:
         print("\n\nMonitoring stopped by user")
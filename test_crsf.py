@@ -4,9 +4,14 @@ ExpressLRS CRSF Test Program
 Simple test script for CRSF receiver functionality
 """
 
+import os
+import select
 import sys
 import time
-from crsf_receiver import CRSFReceiver
+from types import SimpleNamespace
+
+import crsf_receiver
+from crsf_receiver import CRSFReceiver, CRSFFrameType
 
 
 def test_basic_connection(port='/dev/serial0'):
@@ -246,6 +251,168 @@ def test_crc_validation(port='/dev/serial0', duration=5):
         return False
 
 
+def _reference_crc8(data):
+    """
+    Bitwise CRSF CRC8 (DVB-S2, poly 0xD5), independent of crsf_receiver
+    """
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            if crc & 0x80:
+                crc = ((crc << 1) ^ 0xD5) & 0xFF
+            else:
+                crc = (crc << 1) & 0xFF
+    return crc
+
+
+def _build_frame(frame_type, payload, address=0xC8, crc=None):
+    """
+    Build a CRSF frame, with a valid CRC unless one is given
+    """
+    body = bytes([frame_type]) + bytes(payload)
+    if crc is None:
+        crc = _reference_crc8(body)
+    return bytes([address, len(body) + 1]) + body + bytes([crc])
+
+
+def _parse_stream(chunks, use_kernel):
+    """
+    Feed byte chunks through a pipe into a receiver and collect its state
+    """
+    saved_kernel = crsf_receiver._kernel
+    if not use_kernel:
+        crsf_receiver._kernel = None
+    
+    read_fd, write_fd = os.pipe()
+    crsf = CRSFReceiver(port='pipe')
+    # Attach the pipe in place of an opened serial port
+    crsf.serial = SimpleNamespace(is_open=True)
+    crsf._fd = read_fd
+    crsf._poller = select.poll()
+    crsf._poller.register(read_fd, select.POLLIN)
+    
+    try:
+        consumed = 0
+        for chunk in chunks:
+            os.write(write_fd, chunk)
+            consumed += crsf.read_frame()
+        
+        return {
+            'consumed': consumed,
+            'channels': list(crsf.get_channels()),
+            'link_stats': crsf.get_link_statistics(),
+            'frame_count': crsf.frame_count,
+            'error_count': crsf.error_count,
+        }
+    finally:
+        crsf_receiver._kernel = saved_kernel
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_parser_consistency(port=None):
+    """
+    Test the pure-Python and JIT parsers on crafted frames (no hardware;
+    port is unused)
+    """
+    print("\n" + "=" * 80)
+    print("Test 6: Parser Consistency")
+    print("=" * 80)
+    
+    channels = [172, 992, 1811, 0, 2047, 1000, 1500, 172,
+                992, 1811, 1, 2, 1024, 512, 256, 128]
+    packed = sum(ch << (i * 11) for i, ch in enumerate(channels))
+    rc_frame = _build_frame(CRSFFrameType.RC_CHANNELS_PACKED,
+                            packed.to_bytes(22, 'little'))
+    # RSSI 1/2, LQ, SNR (-5 dB), antenna, RF mode, TX power, downlink
+    stats_payload = bytes([70, 75, 100, 0xFB, 1, 4, 2, 80, 99, 8])
+    stats_frame = _build_frame(CRSFFrameType.LINK_STATISTICS, stats_payload)
+    bad_crc = rc_frame[-1] ^ 0xFF
+    bad_frame = _build_frame(CRSFFrameType.RC_CHANNELS_PACKED,
+                             bytes(22), crc=bad_crc)
+    
+    chunks = [
+        bytes(range(1, 40)),            # Garbage (no valid address bytes)
+        rc_frame,
+        bytes([0xC8, 0xFF]),            # Valid address, oversized length
+        stats_frame[:5],                # Frame split across reads
+        stats_frame[5:] + bad_frame,
+        bytes([0xC8, 0x01, 0xC8, 0x00]),  # Frames too short to parse
+        bytes([0xEC, 0x00, 0x00, 0x00]) + rc_frame,
+    ]
+    expected = {
+        'consumed': 4,
+        'channels': channels,
+        'link_stats': {
+            'rssi_1': 70,
+            'rssi_2': 75,
+            'link_quality': 100,
+            'snr': -5,
+            'active_antenna': 1,
+            'rf_mode': 4,
+            'tx_power': 2,
+        },
+        'frame_count': 3,
+        'error_count': 1,
+    }
+    
+    results = [("Pure Python", _parse_stream(chunks, use_kernel=False))]
+    if crsf_receiver._kernel is not None:
+        results.append(("Numba kernel", _parse_stream(chunks, use_kernel=True)))
+    else:
+        print("⚠ numba not installed; JIT kernel not checked")
+    
+    passed = True
+    for name, result in results:
+        if result == expected:
+            print(f"✓ {name} parser matches expected results")
+        else:
+            print(f"✗ {name} parser mismatch:")
+            for key in expected:
+                if result[key] != expected[key]:
+                    print(f"  {key}: {result[key]} (expected {expected[key]})")
+            passed = False
+    
+    return passed
+
+
+def test_crc_known_answers(port=None):
+    """
+    Test CRC8 calculation against known values (no hardware; port is
+    unused)
+    """
+    print("\n" + "=" * 80)
+    print("Test 7: CRC Known Answers")
+    print("=" * 80)
+    
+    # Lengths cover every tail length after the 4-byte steps
+    known_answers = [
+        (b"", 0x00),
+        (bytes.fromhex("16"), 0xD3),
+        (bytes.fromhex("28 00 ea ee 10 20"), 0xC2),
+        (bytes(8), 0x00),
+        (b"123456789", 0xBC),  # CRC-8/DVB-S2 check value
+        (bytes.fromhex("14 46 4b 64 fb 01 04 02 50 63 08"), 0x31),
+        (bytes(range(1, 24)), 0x90),
+    ]
+    
+    crsf = CRSFReceiver()
+    passed = True
+    for data, expected in known_answers:
+        # Frames are parsed through memoryview slices of the receive buffer
+        padded = bytearray(b"\xAA" + data + b"\xAA")
+        crc = crsf._calculate_crc(memoryview(padded)[1:-1])
+        if crc != expected:
+            print(f"✗ CRC of {data.hex()}: {crc:#04x} (expected {expected:#04x})")
+            passed = False
+    
+    if passed:
+        print(f"✓ {len(known_answers)} known CRC values match")
+    
+    return passed
+
+
 def run_all_tests(port='/dev/serial0'):
     """
     Run all tests
@@ -269,6 +436,8 @@ def run_all_tests(port='/dev/serial0'):
         ("Channel Values", test_channel_values),
         ("Link Statistics", test_link_statistics),
         ("CRC Validation", test_crc_validation),
+        ("Parser Consistency", test_parser_consistency),
+        ("CRC Known Answers", test_crc_known_answers),
     ]
     
     results = []